@@ -1,16 +1,68 @@
 __version__ = "0.2.5"
 
-from .__main__ import count_rules, extract_rule, extract_rules
-from .components import (
-    DETAILS_FILE,
-    Rule,
-    StatuteDetails,
-    StatuteSerialCategory,
-    StatuteTitle,
-    StatuteTitleCategory,
-    add_blg,
-    add_num,
-    ltr,
-)
-from .names import NamedPattern, NamedPatternCollection, NamedRules
-from .serials import SerializedRules, SerialPattern, SerialPatternCollection
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .__main__ import (
+        count_rules,
+        extract_rule,
+        extract_rules,
+        extract_rules_batch,
+    )
+    from .components import (
+        CATEGORY_BY_VALUE,
+        CATEGORY_VALUES,
+        DETAILS_FILE,
+        Rule,
+        StatuteDetails,
+        StatuteSerialCategory,
+        StatuteTitle,
+        StatuteTitleCategory,
+        add_blg,
+        add_num,
+        ltr,
+    )
+    from .names import NamedPattern, NamedPatternCollection, NamedRules
+    from .serials import SerializedRules, SerialPattern, SerialPatternCollection
+
+_LAZY: dict[str, str] = {
+    "count_rules": ".__main__",
+    "extract_rule": ".__main__",
+    "extract_rules": ".__main__",
+    "extract_rules_batch": ".__main__",
+    "CATEGORY_BY_VALUE": ".components",
+    "CATEGORY_VALUES": ".components",
+    "DETAILS_FILE": ".components",
+    "Rule": ".components",
+    "StatuteDetails": ".components",
+    "StatuteSerialCategory": ".components",
+    "StatuteTitle": ".components",
+    "StatuteTitleCategory": ".components",
+    "add_blg": ".components",
+    "add_num": ".components",
+    "ltr": ".components",
+    "NamedPattern": ".names",
+    "NamedPatternCollection": ".names",
+    "NamedRules": ".names",
+    "SerializedRules": ".serials",
+    "SerialPattern": ".serials",
+    "SerialPatternCollection": ".serials",
+}
+"""Public names mapped to the submodule that defines them. Importing the
+package stays cheap: patterns are only compiled once a name that needs them,
+e.g. `extract_rules`, is first accessed."""
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if module := _LAZY.get(name):
+        value = getattr(import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -1,10 +1,33 @@
-from collections import Counter
-from collections.abc import Iterator
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import chain
 
 from .components import Rule
 from .names import NamedRules
 from .serials import SerializedRules
 
+_SENTINEL = "\x00"
+"""Joins texts in [`extract_rules_batch()`][extract-rules-in-batch]; it is neither
+whitespace nor a word character so no pattern can match across it."""
+
+
+_CACHED_TEXT_LIMIT = 1024
+"""Only texts up to this length are memoized by `_extract_tuple()`."""
+
+
+def _scan(text: str) -> Iterator[Rule]:
+    return chain(SerializedRules.extract_rules(text), NamedRules.extract_rules(text))
+
+
+@lru_cache(maxsize=512)
+def _extract_tuple(text: str) -> tuple[Rule, ...]:
+    """Short texts, e.g. boilerplate and quoted headnotes, are often re-scanned;
+    keep the rules found in the last 512 distinct ones. Note that the cache keeps
+    the texts themselves in memory, hence the `_CACHED_TEXT_LIMIT`. The cached
+    `Rule` objects are shared across calls which is why they're immutable."""
+    return tuple(_scan(text))
+
 
 def extract_rules(text: str) -> Iterator[Rule]:
     """If text contains [serialized][serial-pattern] (e.g. _Republic Act No. 386_)
@@ -27,8 +50,47 @@ def extract_rules(text: str) -> Iterator[Rule]:
     Yields:
         Iterator[Rule]: Serialized Rules and Named Rule patterns
     """  # noqa: E501
-    yield from SerializedRules.extract_rules(text)
-    yield from NamedRules.extract_rules(text)
+    if len(text) <= _CACHED_TEXT_LIMIT:
+        yield from _extract_tuple(text)
+    else:
+        yield from _scan(text)
+
+
+def extract_rules_batch(texts: Iterable[str]) -> Iterator[list[Rule]]:
+    """Like [`extract_rules()`][extract-rules] but for many texts at once: the
+    texts are joined and each pattern collection scans the joined text only once.
+    The position of each match determines the text it belongs to.
+
+    Examples:
+        >>> from statute_patterns import extract_rules_batch
+        >>> texts = ["Rep Act No. 386", "No statute here.", "the 1987 Constitution"]
+        >>> list(extract_rules_batch(texts))
+        [
+            [Rule(cat='ra', id='386')],
+            [],
+            [Rule(cat='const', id='1987')]
+        ]
+
+    Args:
+        texts (Iterable[str]): Texts to search for statute patterns.
+
+    Yields:
+        Iterator[list[Rule]]: Rules found, one list per text in the same order
+    """  # noqa: E501
+    docs = list(texts)
+    starts: list[int] = []
+    offset = 0
+    for doc in docs:
+        starts.append(offset)
+        offset += len(doc) + len(_SENTINEL)
+
+    found: list[list[Rule]] = [[] for _ in docs]
+    joined = _SENTINEL.join(docs)
+    for collection in (SerializedRules, NamedRules):
+        for match in collection.pattern.finditer(joined):
+            idx = bisect_right(starts, match.start()) - 1
+            found[idx].extend(collection.match_rules(match))
+    yield from found
 
 
 def extract_rule(text: str) -> Rule | None:
@@ -47,10 +109,7 @@ def extract_rule(text: str) -> Rule | None:
     Returns:
         Rule | None: The first Rule found, if it exists
     """  # noqa: E501
-    try:
-        return next(extract_rules(text))
-    except StopIteration:
-        return None
+    return next(_scan(text), None)
 
 
 def count_rules(text: str) -> Iterator[dict]:
@@ -72,5 +131,8 @@ def count_rules(text: str) -> Iterator[dict]:
     Returns:
         Iterator[dict]: Unique rules converted into dicts with their counts
     """  # noqa: E501
-    for k, v in Counter(extract_rules(text)).items():
-        yield k.dict() | {"mentions": v}
+    counts: dict[Rule, int] = {}
+    for rule in extract_rules(text):
+        counts[rule] = counts.get(rule, 0) + 1
+    for k, v in counts.items():
+        yield {"cat": k.cat, "id": k.id, "mentions": v}
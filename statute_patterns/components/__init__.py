@@ -1,13 +1,27 @@
-from .category import StatuteSerialCategory, StatuteTitle, StatuteTitleCategory
+from .category import (
+    CATEGORY_BY_VALUE,
+    CATEGORY_VALUES,
+    StatuteSerialCategory,
+    StatuteTitle,
+    StatuteTitleCategory,
+)
 from .details import StatuteDetails
-from .rule import DETAILS_FILE, STATUTE_PATH, BaseCollection, BasePattern, Rule
+from .rule import DETAILS_FILE, BaseCollection, BasePattern, Rule
 from .utils import (
+    LIMITED_ACTS_PATTERN,
     NON_ACT_INDICATORS,
     add_blg,
     add_num,
     get_regexes,
+    get_statute_path,
     limited_acts,
     ltr,
     not_prefixed_by_any,
     stx,
 )
+
+
+def __getattr__(name: str):
+    if name == "STATUTE_PATH":
+        return get_statute_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
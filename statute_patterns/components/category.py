@@ -1,5 +1,7 @@
 import re
+from collections.abc import Callable
 from enum import Enum
+from functools import lru_cache
 
 from pydantic import BaseModel
 
@@ -126,70 +128,115 @@ class StatuteSerialCategory(str, Enum):
         1. `pd` + `570-a` = `Presidential Decree No. 570-A`
         2. `rule_am` + `03-06-13-sc` = `Administrative Matter No. 03-06-13-SC`
         """
+        return _serialize(self, idx)
 
-        def uncamel(cat: StatuteSerialCategory):
-            """See [Stack Overflow](https://stackoverflow.com/a/9283563)"""
-            x = r"((?<=[a-z])[A-Z]|(?<!\A)[A-Z](?=[a-z]))"
-            return re.sub(x, r" \1", cat.name)
-
-        match self:  # noqa: E999 ; ruff complains but this is valid Python
-            case StatuteSerialCategory.Spain:
-                small_idx = idx.lower()
-                if small_idx in ["civil", "penal"]:
-                    return f"Spanish {idx.title()} Code"
-                elif small_idx == "commerce":
-                    return "Code of Commerce"
-                raise SyntaxWarning(f"{idx=} invalid serial of {self}")
-
-            case StatuteSerialCategory.Constitution:
-                if idx.isdigit() and int(idx) in [1935, 1973, 1987]:
-                    return f"{idx} Constitution"
-                raise SyntaxWarning(f"{idx=} invalid serial of {self}")
-
-            case StatuteSerialCategory.RulesOfCourt:
-                if idx in ["1940", "1964"]:
-                    return f"{idx} Rules of Court"
-                elif idx in ["cpr"]:
-                    return "Code of Professional Responsibility"
-                raise SyntaxWarning(f"{idx=} invalid serial of {self}")
-
-            case StatuteSerialCategory.VetoMessage:
-                """No need to specify No.; understood to mean a Republic Act"""
-                return f"Veto Message - {idx}"
-
-            case StatuteSerialCategory.ResolutionEnBanc:
-                """The `idx` needs to be a specific itemized date."""
-                return f"Resolution of the Court En Banc dated {idx}"
-
-            case StatuteSerialCategory.CircularSC:
-                return f"SC Circular No. {idx}"
-
-            case StatuteSerialCategory.CircularOCA:
-                return f"OCA Circular No. {idx}"
-
-            case StatuteSerialCategory.AdministrativeMatter:
-                """Handle special rule with variants: e.g.`rule_am 00-5-03-sc-1`
-                and `rule_am 00-5-03-sc-2`
-                """
-                am = uncamel(self)
-                small_idx = idx.lower()
-                if "sc" in small_idx:
-                    if small_idx.endswith("sc"):
-                        return f"{am} No. {small_idx.upper()}"
-                    elif sans_var := re.search(r"^.*-sc(?=-\d+)", small_idx):
-                        return f"{am} No. {sans_var.group().upper()}"
-                return f"{am} No. {small_idx.upper()}"
-
-            case StatuteSerialCategory.BatasPambansa:
-                if idx.isdigit():
-                    return (  # there are no -A -B suffixes in BPs
-                        f"{uncamel(self)} Blg. {idx}"
-                    )
-
-            case _:
-                # no need to uppercase pure digits
-                target_digit = idx if idx.isdigit() else idx.upper()
-                return f"{uncamel(self)} No. {target_digit}"
+
+CATEGORY_VALUES: frozenset[str] = frozenset(m.value for m in StatuteSerialCategory)
+"""Valid category values, e.g. `ra`, `rule_am`, for fast membership checks."""
+
+CATEGORY_BY_VALUE: dict[str, StatuteSerialCategory] = {
+    m.value: m for m in StatuteSerialCategory
+}
+"""Members by value, skipping the enum's lookup machinery for known values."""
+
+_UNCAMEL = re.compile(r"((?<=[a-z])[A-Z]|(?<!\A)[A-Z](?=[a-z]))")
+_AM_SC_VAR = re.compile(r"^.*-sc(?=-\d+)")
+
+_SPACED: dict[StatuteSerialCategory, str] = {
+    member: _UNCAMEL.sub(r" \1", member.name) for member in StatuteSerialCategory
+}
+"""Each member's "uncamel"-ized name, e.g. `RepublicAct` becomes `Republic Act`.
+See [Stack Overflow](https://stackoverflow.com/a/9283563)"""
+
+
+def _spain(cat: StatuteSerialCategory, idx: str) -> str:
+    small_idx = idx.lower()
+    if small_idx in ["civil", "penal"]:
+        return f"Spanish {idx.title()} Code"
+    elif small_idx == "commerce":
+        return "Code of Commerce"
+    raise SyntaxWarning(f"{idx=} invalid serial of {cat}")
+
+
+def _constitution(cat: StatuteSerialCategory, idx: str) -> str:
+    if idx.isdigit() and int(idx) in [1935, 1973, 1987]:
+        return f"{idx} Constitution"
+    raise SyntaxWarning(f"{idx=} invalid serial of {cat}")
+
+
+def _roc(cat: StatuteSerialCategory, idx: str) -> str:
+    if idx in ["1940", "1964"]:
+        return f"{idx} Rules of Court"
+    elif idx in ["cpr"]:
+        return "Code of Professional Responsibility"
+    raise SyntaxWarning(f"{idx=} invalid serial of {cat}")
+
+
+def _veto(cat: StatuteSerialCategory, idx: str) -> str:
+    """No need to specify No.; understood to mean a Republic Act"""
+    return f"Veto Message - {idx}"
+
+
+def _reso(cat: StatuteSerialCategory, idx: str) -> str:
+    """The `idx` needs to be a specific itemized date."""
+    return f"Resolution of the Court En Banc dated {idx}"
+
+
+def _sc_cir(cat: StatuteSerialCategory, idx: str) -> str:
+    return f"SC Circular No. {idx}"
+
+
+def _oca_cir(cat: StatuteSerialCategory, idx: str) -> str:
+    return f"OCA Circular No. {idx}"
+
+
+def _am(cat: StatuteSerialCategory, idx: str) -> str:
+    """Handle special rule with variants: e.g.`rule_am 00-5-03-sc-1`
+    and `rule_am 00-5-03-sc-2`
+    """
+    am = _SPACED[cat]
+    small_idx = idx.lower()
+    if "sc" in small_idx:
+        if small_idx.endswith("sc"):
+            return f"{am} No. {small_idx.upper()}"
+        elif sans_var := _AM_SC_VAR.search(small_idx):
+            return f"{am} No. {sans_var.group().upper()}"
+    return f"{am} No. {small_idx.upper()}"
+
+
+def _bp(cat: StatuteSerialCategory, idx: str) -> str | None:
+    if idx.isdigit():
+        return f"{_SPACED[cat]} Blg. {idx}"  # there are no -A -B suffixes in BPs
+    return None
+
+
+def _default(cat: StatuteSerialCategory, idx: str) -> str:
+    # no need to uppercase pure digits
+    target_digit = idx if idx.isdigit() else idx.upper()
+    return f"{_SPACED[cat]} No. {target_digit}"
+
+
+_HANDLERS: dict[
+    StatuteSerialCategory, Callable[[StatuteSerialCategory, str], str | None]
+] = {
+    StatuteSerialCategory.Spain: _spain,
+    StatuteSerialCategory.Constitution: _constitution,
+    StatuteSerialCategory.RulesOfCourt: _roc,
+    StatuteSerialCategory.VetoMessage: _veto,
+    StatuteSerialCategory.ResolutionEnBanc: _reso,
+    StatuteSerialCategory.CircularSC: _sc_cir,
+    StatuteSerialCategory.CircularOCA: _oca_cir,
+    StatuteSerialCategory.AdministrativeMatter: _am,
+    StatuteSerialCategory.BatasPambansa: _bp,
+}
+"""Members with a special serial title format; all others use `_default()`."""
+
+
+@lru_cache(maxsize=4096)
+def _serialize(cat: StatuteSerialCategory, idx: str) -> str | None:
+    """Memoized body of `StatuteSerialCategory.serialize()`; the same
+    (category, identifier) pairs recur across extracted rules."""
+    return _HANDLERS.get(cat, _default)(cat, idx)
 
 
 class StatuteTitle(BaseModel):
@@ -201,6 +248,7 @@ class StatuteTitle(BaseModel):
 
     class Config:
         use_enum_values = True
+        allow_mutation = False
 
     @classmethod
     def generate(
@@ -211,31 +259,58 @@ class StatuteTitle(BaseModel):
         short: str | None = None,
         aliases: list[str] | None = None,
     ):
-        if aliases:
-            for title in aliases:
-                if title and title != "":
-                    yield cls(
-                        statute_id=pk,
-                        category=StatuteTitleCategory.Alias,
-                        text=title,
-                    )
-        if short:
-            yield cls(
+        """Inputs are trusted, i.e. sourced from a statute's own files, so
+        validation is skipped with `construct()`; the category is set to its
+        `value` to match `use_enum_values`. The same statute is often regenerated,
+        hence the titles are cached per set of arguments."""
+        yield from _generate_titles(
+            cls, pk, official, serial, short, tuple(aliases or ())
+        )
+
+
+@lru_cache(maxsize=2048)
+def _generate_titles(
+    cls: type[StatuteTitle],
+    pk: str,
+    official: str | None,
+    serial: str | None,
+    short: str | None,
+    aliases: tuple[str, ...],
+) -> tuple[StatuteTitle, ...]:
+    titles: list[StatuteTitle] = []
+    for title in aliases:
+        if title and title != "":
+            titles.append(
+                cls.construct(
+                    statute_id=pk,
+                    category=StatuteTitleCategory.Alias.value,
+                    text=title,
+                )
+            )
+    if short:
+        titles.append(
+            cls.construct(
                 statute_id=pk,
-                category=StatuteTitleCategory.Short,
+                category=StatuteTitleCategory.Short.value,
                 text=short,
             )
+        )
 
-        if serial:
-            yield cls(
+    if serial:
+        titles.append(
+            cls.construct(
                 statute_id=pk,
-                category=StatuteTitleCategory.Serial,
+                category=StatuteTitleCategory.Serial.value,
                 text=serial,
             )
+        )
 
-        if official:
-            yield cls(
+    if official:
+        titles.append(
+            cls.construct(
                 statute_id=pk,
-                category=StatuteTitleCategory.Official,
+                category=StatuteTitleCategory.Official.value,
                 text=official,
             )
+        )
+    return tuple(titles)
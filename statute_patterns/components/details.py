@@ -1,4 +1,7 @@
 import datetime
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
@@ -9,7 +12,36 @@ from slugify import slugify
 from .category import StatuteTitle
 from .rule import Rule
 from .short import get_short
-from .utils import DETAILS_FILE, STATUTE_PATH, set_units
+from .utils import DETAILS_FILE, YAML_LOADER, get_statute_path, set_units
+
+_SAFE_SLUG = re.compile(r"[a-z0-9]+(?:[ _-][a-z0-9]+)*")
+"""Lowercase ASCII words joined by single spaces, underscores or dashes, e.g.
+`rule_am 00-5-03-sc 2000-10-03`: `slugify()` would only turn the spaces and
+underscores into dashes."""
+
+_SLUG_DASHES = str.maketrans({" ": "-", "_": "-"})
+
+
+_EXISTING_ROOTS: set[Path] = set()
+
+
+def _root_exists(base_path: Path) -> bool:
+    """Once a statutes folder is found it is not checked again for every statute;
+    a missing folder is checked on each call so it can be created later."""
+    if base_path in _EXISTING_ROOTS:
+        return True
+    if base_path.exists():
+        _EXISTING_ROOTS.add(base_path)
+        return True
+    return False
+
+
+def _parse_date(value: str | datetime.date) -> datetime.date:
+    """Unquoted ISO dates are already loaded by YAML as dates; anything else,
+    e.g. "June 18, 1949", goes through dateutil's lenient parser."""
+    if isinstance(value, datetime.date):
+        return value
+    return parse(value).date()
 
 
 class StatuteDetails(BaseModel):
@@ -41,34 +73,43 @@ class StatuteDetails(BaseModel):
     units: list[dict]
 
     @classmethod
-    def slug_id(cls, p: Path, dt: str, v: int | None):
+    def slug_id(cls, p: Path, dt: str | datetime.date, v: int | None):
         """Use the path's parameters with the date and variant, to
         create a slug that can serve as the url / primary key of the
         statute."""
-        _temp = [p.parent.parent.stem, p.parent.stem, dt]
+        _temp = [p.parent.parent.stem, p.parent.stem, str(dt)]
         if v:
             _temp.append(str(v))
-        return slugify(" ".join(_temp))
+        text = " ".join(_temp).lower()
+        if _SAFE_SLUG.fullmatch(text):
+            return text.translate(_SLUG_DASHES)
+        return slugify(text)
 
     @classmethod
-    def from_rule(cls, rule: Rule, base_path: Path = STATUTE_PATH):
+    def from_rule(cls, rule: Rule, base_path: Path | None = None):
         """From a constructed rule (see [`Rule.from_path`][statute_patterns.components.rule.Rule.from_path]), get the
         details of said rule.  Limitation: the category and identifier must
         be unique."""  # noqa: E501
-        if not base_path.exists():
+        base_path = base_path or get_statute_path()
+        if not _root_exists(base_path):
             raise Exception(f"Could not get proper {base_path=}.")
 
         if not rule.serial_title:
             raise Exception("No serial title created.")
 
-        _file = None
+        _file, st = None, None
         if folder := rule.get_path(base_path):
             _file = folder / DETAILS_FILE
+            try:
+                st = _file.stat()
+            except FileNotFoundError:
+                pass
 
-        if not _file or not _file.exists():
+        if not _file or not st:
             raise Exception(f"No _file found from {folder=} {base_path=}.")
 
-        d = yaml.safe_load(_file.read_bytes())
+        with _file.open("rb") as f:
+            d = yaml.load(f, Loader=YAML_LOADER)
         dt, ofc_title, v = d.get("date"), d.get("law_title"), d.get("variant")
         if not all([ofc_title, dt]):
             raise Exception(f"Fail on: {dt=}, {ofc_title=}, {v=}")
@@ -82,15 +123,30 @@ class StatuteDetails(BaseModel):
             aliases=d.get("aliases"),
         )
         return cls(
-            created=_file.stat().st_ctime,
-            modified=_file.stat().st_mtime,
+            created=st.st_ctime,
+            modified=st.st_mtime,
             rule=rule,
             id=idx,
             title=rule.serial_title,
             description=ofc_title,
             emails=d.get("emails", ["bot@lawsql.com"]),  # default to generic
-            date=parse(d["date"]).date(),
+            date=_parse_date(d["date"]),
             variant=v or 1,  # default to 1
             units=units,
             titles=list(titles),
         )
+
+    @classmethod
+    def bulk_from_rules(
+        cls,
+        rules: Iterable[Rule],
+        base_path: Path | None = None,
+        max_workers: int = 8,
+    ) -> list["StatuteDetails"]:
+        """Apply [`from_rule`][statute_patterns.components.details.StatuteDetails.from_rule]
+        to each of the `rules` using a thread pool, preserving their order. Only the
+        file system calls and reads overlap; YAML parsing and model validation hold
+        the GIL, so the gain depends on how slow the storage is."""  # noqa: E501
+        base_path = base_path or get_statute_path()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda r: cls.from_rule(r, base_path), rules))
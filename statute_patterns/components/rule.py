@@ -1,13 +1,22 @@
 import abc
+import os
 import re
+import sys
 from collections.abc import Iterator
 from pathlib import Path
-from re import Pattern
+from re import Match, Pattern
 
-from pydantic import BaseModel, Field, constr, validator
+from pydantic import BaseModel, Field, PrivateAttr, constr, validator
 
-from .category import StatuteSerialCategory
-from .utils import DETAILS_FILE, STATUTE_PATH
+from .category import CATEGORY_BY_VALUE, StatuteSerialCategory
+from .utils import DETAILS_FILE, get_statute_path
+
+_PATH_CACHE: dict[tuple[str, str, str], Path | None] = {}
+"""Results of `Rule.get_path()` keyed by base path, category and id, misses
+included; cleared with `Rule.invalidate()`."""
+
+_PATHS_CACHE: dict[tuple[str, str, str], list[Path]] = {}
+"""Results of `Rule.get_paths()`, see `_PATH_CACHE`."""
 
 
 class Rule(BaseModel):
@@ -41,20 +50,23 @@ class Rule(BaseModel):
 
     class Config:
         use_enum_values = True
+        allow_mutation = False
 
     def __hash__(self):
         """Pydantic models are [not hashable by default](https://github.com/pydantic/pydantic/issues/1303#issuecomment-599712964).
         It is implemented here to take advantage of `collections.Counter` which works only on objects with a __hash__. This is the
         basis of [`count_rules()`][count-rules]."""  # noqa: E501
-        return hash((type(self),) + tuple(self.__dict__.values()))
+        return hash((self.cat, self.id))
 
     @validator("cat", pre=True)
     def category_in_lower_case(cls, v):
-        return StatuteSerialCategory(v.lower())
+        return CATEGORY_BY_VALUE.get(v) or StatuteSerialCategory(v.lower())
 
-    @validator("id", pre=True)
-    def serial_id_lower(cls, v):
-        return v.lower()
+    @validator("id")
+    def serial_id_interned(cls, v):
+        """Identifiers recur across texts; interning them makes hashing and
+        comparison in `collections.Counter` cheaper."""
+        return sys.intern(v)
 
     @classmethod
     def get_details(cls, details_path: Path):
@@ -82,21 +94,26 @@ class Rule(BaseModel):
 
     @property
     def serial_title(self):
-        return StatuteSerialCategory(self.cat).serialize(self.id)
+        return CATEGORY_BY_VALUE[self.cat].serialize(self.id)
 
-    def get_path(self, base_path: Path = STATUTE_PATH) -> Path | None:
+    def get_path(self, base_path: Path | None = None) -> Path | None:
         """For most cases, there only be one path to path/to/statutes/ra/386 where:
 
         1. path/to/statutes = base_path
         2. 'ra' is the category
         3. '386' is the id.
-        """
-        target = base_path / self.cat / self.id
-        if target.exists():
-            return target
-        return None
 
-    def get_paths(self, base_path: Path = STATUTE_PATH) -> list[Path]:
+        Results, including misses, are cached per base path until
+        `Rule.invalidate()` is called.
+        """
+        base_path = base_path or get_statute_path()
+        key = (str(base_path), self.cat, self.id)
+        if key not in _PATH_CACHE:
+            target = base_path / self.cat / self.id
+            _PATH_CACHE[key] = target if target.is_dir() else None
+        return _PATH_CACHE[key]
+
+    def get_paths(self, base_path: Path | None = None) -> list[Path]:
         """
         Ordinarily, the following directory structure would suffice
         in generating the path to a unique statute:
@@ -142,19 +159,38 @@ class Rule(BaseModel):
         ```
 
         Unlike `get_path()` which only retrieves one Path, all Paths will be retrieved
-        using the plural form of the function `self.get_paths()`
+        using the plural form of the function `self.get_paths()`; like the former,
+        results are cached until `Rule.invalidate()` is called.
         """
+        base_path = base_path or get_statute_path()
+        key = (str(base_path), self.cat, self.id)
+        if key in _PATHS_CACHE:
+            return list(_PATHS_CACHE[key])
+
         targets = []
-        target = base_path / self.cat
-        paths = target.glob(f"{self.id}-*/{DETAILS_FILE}")
-        for variant_path in paths:
-            if variant_path.exists():
-                targets.append(variant_path.parent)
-        return targets
-
-    def extract_folders(self, base_path: Path = STATUTE_PATH) -> Iterator[Path]:
+        prefix = f"{self.id}-"
+        try:
+            with os.scandir(base_path / self.cat) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and entry.is_dir():
+                        if os.path.isfile(os.path.join(entry.path, DETAILS_FILE)):
+                            targets.append(Path(entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        _PATHS_CACHE[key] = targets
+        return list(targets)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget the folders found by `get_path()` and `get_paths()`, e.g. after
+        statutes are added to or removed from the base path."""
+        _PATH_CACHE.clear()
+        _PATHS_CACHE.clear()
+
+    def extract_folders(self, base_path: Path | None = None) -> Iterator[Path]:
         """Using the `category` and `id` of the object,
         get the possible folder paths."""
+        base_path = base_path or get_statute_path()
         if folder := self.get_path(base_path):
             yield folder
         else:
@@ -170,11 +206,11 @@ class Rule(BaseModel):
             variant, e.g. `units.yaml`
         """
         preferred = statute_folder / f"{self.cat}{self.id}.yaml"
-        if preferred.exists():
+        if os.path.isfile(preferred):
             return preferred
 
         default = statute_folder / "units.yaml"
-        if default.exists():
+        if os.path.isfile(default):
             return default
 
         return None
@@ -190,14 +226,30 @@ class BasePattern(BaseModel, abc.ABC):
         description="When supplied, text included _should not_ match regex property.",
     )
 
+    _pattern: Pattern = PrivateAttr()
+
     class Config:
         use_enum_values = True
+        allow_mutation = False
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._setup()
         self.validate_matches()
         self.validate_excludes()
 
+    def _setup(self) -> None:
+        """Compile `pattern` from the fields. Subclasses extend this with
+        their own compiled patterns."""
+        self._pattern = re.compile(self.regex, re.X)
+
+    def copy(self, **kwargs):
+        """pydantic's `copy()` skips `__init__` and carries private attributes
+        over, so recompile them from the copied fields."""
+        obj = super().copy(**kwargs)
+        obj._setup()
+        return obj
+
     @property
     @abc.abstractmethod
     def regex(self) -> str:
@@ -215,19 +267,22 @@ class BasePattern(BaseModel, abc.ABC):
     @property
     def pattern(self) -> Pattern:
         """Enables use of a unique Pattern object per rule pattern created,
-        regardless of it being a SerialPattern or a NamedPattern."""
-        return re.compile(self.regex, re.X)
+        regardless of it being a SerialPattern or a NamedPattern. Compiled
+        once on instantiation; the fields cannot be reassigned afterwards."""
+        return self._pattern
 
     def validate_matches(self) -> None:
+        fullmatch = self.pattern.fullmatch
         for example_text in self.matches:
-            if not self.pattern.fullmatch(example_text):
+            if not fullmatch(example_text):
                 raise ValueError(
                     f"Missing match but intended to be included: {example_text}"
                 )
 
     def validate_excludes(self) -> None:
+        fullmatch = self.pattern.fullmatch
         for example_text in self.excludes:
-            if self.pattern.fullmatch(example_text):
+            if fullmatch(example_text):
                 raise ValueError(
                     f"Match found even if intended to be excluded: {example_text}."
                 )
@@ -237,14 +292,52 @@ class BaseCollection(BaseModel, abc.ABC):
     """Whether a collection of Named or Serial patterns are instantiated,
     a `combined_regex` property and a `pattern` propery will be automatically
     created based on the collection of objects declared on instantiation
-    of the class."""
+    of the class. Since the pattern is compiled at that point, the collection
+    is frozen into a tuple and cannot be reassigned afterwards."""
 
-    collection: list = NotImplemented
+    collection: tuple = NotImplemented
+    hint: Pattern | None = Field(
+        None,
+        description=(
+            "When supplied, text without a match for this cheap pattern is"
+            " skipped before running the combined `pattern`."
+        ),
+    )
+    _pattern: Pattern = PrivateAttr()
 
-    @abc.abstractmethod
-    def extract_rules(self, text: str) -> Iterator[Rule]:
+    class Config:
+        allow_mutation = False
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._setup()
+
+    def _setup(self) -> None:
+        """Compile `pattern` from the collection. Subclasses extend this to
+        build their lookup tables."""
+        self._pattern = re.compile(self.combined_regex, re.X)
+
+    def copy(self, **kwargs):
+        """pydantic's `copy()` skips `__init__` and carries private attributes
+        over, so rebuild them from the copied collection."""
+        obj = super().copy(**kwargs)
+        obj._setup()
+        return obj
+
+    def match_rules(self, match: Match) -> Iterator[Rule]:
+        """Convert a single `match` of the collection's `pattern` into its Rule
+        objects. Subclasses implement either this hook or `extract_rules()`."""
         raise NotImplementedError("Need ability to fetch Rule objects.")
 
+    def extract_rules(self, text: str) -> Iterator[Rule]:
+        """Each `match` found by the collection's `pattern` is converted
+        into its Rule objects via `match_rules()`. Subclasses may override this
+        instead."""
+        if self.hint and not self.hint.search(text):
+            return
+        for match in self.pattern.finditer(text):
+            yield from self.match_rules(match)
+
     @property
     def combined_regex(self) -> str:
         """Combine the different items in the collection
@@ -253,4 +346,5 @@ class BaseCollection(BaseModel, abc.ABC):
 
     @property
     def pattern(self) -> Pattern:
-        return re.compile(self.combined_regex, re.X)
+        """Compiled once on instantiation of the collection."""
+        return self._pattern
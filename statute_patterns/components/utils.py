@@ -1,17 +1,34 @@
 import os
+import re
 from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
+from re import Pattern
 
 import yaml
 from dotenv import find_dotenv, load_dotenv
 
-load_dotenv(find_dotenv())
 
+@lru_cache(maxsize=1)
+def get_statute_path() -> Path:
+    """The default folder of statutes: the `STATUTE_PATH` environment variable,
+    relative to the user's home directory. The `.env` file is only searched for
+    and loaded on the first call."""
+    load_dotenv(find_dotenv())
+    return Path().home().joinpath(os.getenv("STATUTE_PATH", "code/corpus/statutes"))
+
+
+def __getattr__(name: str):
+    if name == "STATUTE_PATH":
+        return get_statute_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-STATUTE_PATH = Path().home().joinpath(os.getenv("STATUTE_PATH", "code/corpus/statutes"))
 
 DETAILS_FILE = "details.yaml"
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""Use the libyaml-backed safe loader when PyYAML was built with it."""
+
 UNITS_MONEY = [
     {
         "item": "Container 1",
@@ -30,19 +47,23 @@ def set_units(title: str, p: Path | None) -> list[dict]:
     """Extract the raw units of the statute and apply a special rule on appropriation
     laws when they're found."""
     if p:
-        if p.exists():
-            try:
-                units_as_list = yaml.safe_load(p.read_bytes())
-                if not isinstance(units_as_list, list):
-                    return UNITS_NONE
-                return units_as_list
-            except Exception:
+        try:
+            with p.open("rb") as f:
+                units_as_list = yaml.load(f, Loader=YAML_LOADER)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            return UNITS_NONE
+        else:
+            if not isinstance(units_as_list, list):
                 return UNITS_NONE
-    if all([title and "appropriat" in title.lower()]):
+            return units_as_list
+    if title and "appropriat" in title.lower():
         return UNITS_MONEY
     return UNITS_NONE
 
 
+@lru_cache(maxsize=None)
 def stx(regex_text: str):
     """Remove indention of raw regex strings. This makes regex more readable when using
     rich.Syntax(<target_regex_string>, "python")"""
@@ -51,6 +72,7 @@ def stx(regex_text: str):
 """
 
 
+@lru_cache(maxsize=None)
 def ltr(*args) -> str:
     """
     Most statutes are referred to in the following way:
@@ -62,11 +84,13 @@ def ltr(*args) -> str:
     return rf"(?:\b{joined}\.?)"
 
 
+@lru_cache(maxsize=None)
 def add_num(prefix: str) -> str:
     num = r"(\s+No\.?s?\.?)?"
     return rf"{prefix}{num}"
 
 
+@lru_cache(maxsize=None)
 def add_blg(prefix: str) -> str:
     blg = r"(\s+Blg\.?)?"
     return rf"{prefix}{blg}"
@@ -101,3 +125,5 @@ NON_ACT_INDICATORS = [
 """If the word act is preceded by these phrases, do not consider the same to be a
 legacy act of congress."""
 limited_acts = not_prefixed_by_any(rf"{add_num(r'Acts?')}", NON_ACT_INDICATORS)
+LIMITED_ACTS_PATTERN: Pattern = re.compile(limited_acts, re.X)
+"""`limited_acts` compiled once, for callers that match it on its own."""
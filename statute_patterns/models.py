@@ -1,8 +1,9 @@
 import re
+import sys
 from collections.abc import Iterator
-from re import Pattern
+from re import Match, Pattern
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from slugify import slugify
 
 from .components import (
@@ -39,13 +40,16 @@ class NamedPatternCollection(BaseCollection):
     'Code of Professional Responsibility'.
     """
 
-    collection: list[NamedPattern]
+    collection: tuple[NamedPattern, ...]
+    _rules: dict[str, Rule] = PrivateAttr()
 
-    def extract_rules(self, text: str) -> Iterator[Rule]:
-        for m in self.pattern.finditer(text):
-            for named in self.collection:
-                if m.lastgroup == named.group_name:
-                    yield named.rule
+    def _setup(self) -> None:
+        super()._setup()
+        self._rules = {named.group_name: named.rule for named in self.collection}
+
+    def match_rules(self, match: Match) -> Iterator[Rule]:
+        if rule := self._rules.get(match.lastgroup):
+            yield rule
 
 
 class SerialPattern(BasePattern):
@@ -93,6 +97,12 @@ class SerialPattern(BasePattern):
         ),
     )
 
+    _digits_in_match: Pattern = PrivateAttr()
+
+    def _setup(self) -> None:
+        super()._setup()
+        self._digits_in_match = re.compile(r"|".join(self.regex_serials))
+
     @property
     def lines(self) -> Iterator[str]:
         """Each regex string produced matches the serial rule. Note the line break
@@ -113,7 +123,9 @@ class SerialPattern(BasePattern):
 
     @property
     def digits_in_match(self) -> Pattern:
-        return re.compile(r"|".join(self.regex_serials))
+        """Compiled once on instantiation; used on every match found by the
+        collection."""
+        return self._digits_in_match
 
 
 class SerialPatternCollection(BaseCollection):
@@ -121,13 +133,20 @@ class SerialPatternCollection(BaseCollection):
     regex string, e.g. Republic Act is a category, a serial number for
     this category is 386 representing the Philippine Civil Code."""
 
-    collection: list[SerialPattern]
+    collection: tuple[SerialPattern, ...]
+    _patterns: dict[str, SerialPattern] = PrivateAttr()
+    _rules: dict[tuple[str, str], Rule] = PrivateAttr()
 
-    def extract_rules(self, text: str) -> Iterator[Rule]:
-        """Each `m`, a python Match object, represents a
+    def _setup(self) -> None:
+        super()._setup()
+        self._patterns = {sp.group_name: sp for sp in self.collection}
+        self._rules = {}
+
+    def match_rules(self, match: Match) -> Iterator[Rule]:
+        """Each `match`, a python Match object, represents a
         serial pattern category with possible ambiguous identifier found.
 
-        So running `m.group(0)` should yield the entire text of the
+        So running `match.group(0)` should yield the entire text of the
         match which consists of (a) the definitive category;
         and (b) the ambiguous identifier.
 
@@ -137,11 +156,19 @@ class SerialPatternCollection(BaseCollection):
 
         This function splits the identifier by commas `,` and the
         word `and` to get the individual component identifiers.
+
+        Since `sp.cat` is an already validated category value, the `Rule`
+        is created with `construct()`, skipping validation; the identifier
+        is normalized here the way `Rule`'s validators would have. Rules are
+        immutable so the same object is reused for every mention of a
+        category and identifier.
         """
-        for match in self.pattern.finditer(text):
-            for sp in self.collection:
-                if match.lastgroup == sp.group_name:
-                    if candidates := sp.digits_in_match.search(match.group(0)):
-                        for d in split_digits(candidates.group(0)):
-                            c = sp.cat
-                            yield Rule(cat=c, id=d)
+        if sp := self._patterns.get(match.lastgroup):
+            text, start, end = match.string, match.start(), match.end()
+            if candidates := sp.digits_in_match.search(text, start, end):
+                for d in split_digits(candidates.group(0)):
+                    key = (sp.cat, d.lower())
+                    if (rule := self._rules.get(key)) is None:
+                        rule = Rule.construct(cat=sp.cat, id=sys.intern(key[1]))
+                        self._rules[key] = rule
+                    yield rule
@@ -175,5 +175,6 @@ NamedRules = NamedPatternCollection(
     collection=[civ1950, rpc1930, corpcode_old, corpcode_revised, cpr]
     + spain_codes
     + const_years
-    + roc_years
+    + roc_years,
+    hint=r"(?i)\d|code|cpr",  # a year, a code, or the CPR
 )
@@ -106,6 +106,8 @@ PD_DIGITS_PLUS = rf"{pds_with_letters}|{PD_DIGITS}"
 
 EXTENDERS = "|".join([",", r"\s+", r"(\sand\s)"])
 SEPARATOR: Pattern = re.compile(EXTENDERS)
+TOKEN: Pattern = re.compile(r"[^,\s]+")
+"""Anything between the commas and spaces of `EXTENDERS`."""
 
 
 def digitize(allowed_digits: str) -> str:
@@ -115,6 +117,6 @@ def digitize(allowed_digits: str) -> str:
 
 
 def split_digits(text: str):
-    for a in SEPARATOR.split(text):
-        if a and a.strip() and a != "and":  # removes None, ''
-            yield a.strip()
+    for token in TOKEN.finditer(text):
+        if (a := token.group(0)) != "and":
+            yield a
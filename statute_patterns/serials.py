@@ -252,5 +252,6 @@ SerializedRules = SerialPatternCollection(
         oca_cir,
         veto,
         rule_reso,
-    ]
+    ],
+    hint=r"\d",  # every serial identifier has a digit
 )
@@ -1,10 +1,6 @@
-import re
-
 import pytest
 
-from statute_patterns.components import limited_acts
-
-act = re.compile(limited_acts, re.X)
+from statute_patterns.components import LIMITED_ACTS_PATTERN as act
 
 
 @pytest.mark.parametrize(
@@ -1,13 +1,25 @@
 import pytest
 
 from statute_patterns import (
+    CATEGORY_VALUES,
     NamedRules,
     SerializedRules,
     StatuteDetails,
+    StatuteSerialCategory,
     StatuteTitle,
     count_rules,
     extract_rules,
+    extract_rules_batch,
 )
+from statute_patterns.names import civ1950
+from statute_patterns.serials import ra
+
+
+def as_pairs(items) -> list[tuple[str, str]]:
+    """Compare rules and expected dicts by their only two fields."""
+    return [
+        (i["cat"], i["id"]) if isinstance(i, dict) else (i.cat, i.id) for i in items
+    ]
 
 
 def test_category_serializer(rule_obj):
@@ -94,7 +106,7 @@ def test_loaded_data(rule_obj, statute_details):
     ],
 )
 def test_extract_rules(text, extracted, counted):
-    assert list(i.dict() for i in extract_rules(text)) == extracted
+    assert as_pairs(extract_rules(text)) == as_pairs(extracted)
     assert list(count_rules(text)) == counted
 
 
@@ -111,7 +123,7 @@ def test_extract_rules(text, extracted, counted):
     ],
 )
 def test_extract_rules_named(text, result):
-    assert list(i.dict() for i in NamedRules.extract_rules(text)) == result
+    assert as_pairs(NamedRules.extract_rules(text)) == as_pairs(result)
 
 
 @pytest.mark.parametrize(
@@ -176,4 +188,61 @@ def test_extract_rules_named(text, result):
     ],
 )
 def test_rule_find_all(text, result):
-    assert list(i.dict() for i in SerializedRules.extract_rules(text)) == result
+    assert as_pairs(SerializedRules.extract_rules(text)) == as_pairs(result)
+
+
+def test_extract_rules_batch():
+    texts = [
+        "Republic Act No. 386, 1114, and 11000-",
+        "No statute here.",
+        "This is the 1987 PHIL CONST; hello world, the Spanish Penal Code.",
+        "The Civil Code of the Philippines; Rep Act No. 386",
+    ]
+    assert list(extract_rules_batch(texts)) == [
+        list(extract_rules(text)) for text in texts
+    ]
+
+
+def test_collection_is_frozen():
+    with pytest.raises(AttributeError):
+        NamedRules.collection.append(NamedRules.collection[0])
+    with pytest.raises(TypeError):
+        NamedRules.collection = ()
+
+
+def test_pattern_copy():
+    foo = civ1950.copy(update={"regex_base": r"Foo\s+Code"})
+    assert foo.pattern.fullmatch("Foo Code")
+    assert not civ1950.pattern.fullmatch("Foo Code")
+    with pytest.raises(TypeError):
+        civ1950.regex_base = r"Foo\s+Code"
+
+
+def test_serial_pattern_copy():
+    digits = ra.copy(update={"regex_serials": [r"\d+"]}).digits_in_match
+    assert digits.pattern == r"\d+"
+    assert ra.digits_in_match.pattern != r"\d+"
+    with pytest.raises(TypeError):
+        ra.regex_serials = [r"\d+"]
+
+
+def test_collection_copy():
+    text = "the 1987 Constitution and the Civil Code, RA 386"
+    named = NamedRules.copy(update={"collection": NamedRules.collection[:1]})
+    assert as_pairs(named.extract_rules(text)) == [("ra", "386")]
+    serial = SerializedRules.copy(update={"collection": SerializedRules.collection[1:]})
+    assert list(serial.extract_rules(text)) == []
+    assert as_pairs(SerializedRules.extract_rules(text)) == [("ra", "386")]
+
+
+@pytest.mark.parametrize("collection", [SerializedRules, NamedRules])
+def test_collection_hint(collection):
+    assert list(collection.extract_rules("No statute mentioned here.")) == []
+    for pattern in collection.collection:
+        for sample in pattern.matches:
+            assert collection.hint.search(sample)
+
+
+def test_category_values():
+    assert CATEGORY_VALUES == {member.value for member in StatuteSerialCategory}
+    assert "ra" in CATEGORY_VALUES and "misc" not in CATEGORY_VALUES
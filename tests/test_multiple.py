@@ -1,4 +1,9 @@
-from statute_patterns import DETAILS_FILE, Rule
+import datetime
+
+import pytest
+from slugify import slugify
+
+from statute_patterns import DETAILS_FILE, Rule, StatuteDetails
 
 
 def test_folders_from_rule(base_folder, rule_am_00503_sc):
@@ -11,3 +16,48 @@ def test_description_path(base_folder, rule_am_00503_sc):
         if detail := Rule.get_details(a / DETAILS_FILE):
             assert detail.title == "Administrative Matter No. 00-5-03-SC"
             assert a.stem in detail.id
+
+
+def test_bulk_from_rules(base_folder, rule_am_00503_sc):
+    rules = [
+        Rule.from_path(folder / DETAILS_FILE)
+        for folder in rule_am_00503_sc.extract_folders(base_folder)
+    ]
+    details = StatuteDetails.bulk_from_rules(rules, base_folder, max_workers=2)
+    assert [d.id for d in details] == [
+        StatuteDetails.from_rule(r, base_folder).id for r in rules
+    ]
+
+
+def test_invalidate_paths(tmp_path, rule_am_00503_sc):
+    assert rule_am_00503_sc.get_paths(tmp_path) == []
+    variant = tmp_path / "rule_am" / "00-5-03-sc-1"
+    variant.mkdir(parents=True)
+    (variant / DETAILS_FILE).touch()
+    assert rule_am_00503_sc.get_paths(tmp_path) == []  # cached miss
+    Rule.invalidate()
+    assert rule_am_00503_sc.get_paths(tmp_path) == [variant]
+
+
+def test_unquoted_iso_date(tmp_path):
+    folder = tmp_path / "ra" / "1"
+    folder.mkdir(parents=True)
+    (folder / DETAILS_FILE).write_text("law_title: An Act\ndate: 2020-01-02\n")
+    detail = Rule.get_details(folder / DETAILS_FILE)
+    assert detail.date == datetime.date(2020, 1, 2)
+    assert detail.id == "ra-1-2020-01-02"
+
+
+@pytest.mark.parametrize(
+    "cat, idx, dt, v",
+    [
+        ("ra", "386", "1949-06-18", None),  # fast path
+        ("rule_am", "00-5-03-sc-1", datetime.date(2000, 10, 3), 2),  # fast path
+        ("ra", "386", "June 18, 1949", None),  # slugify
+        ("spain", "civil", "Ré 1, 1889", 1),  # slugify
+    ],
+)
+def test_slug_id_matches_slugify(tmp_path, cat, idx, dt, v):
+    p = tmp_path / cat / idx / DETAILS_FILE
+    parts = [cat, idx, str(dt)] + ([str(v)] if v else [])
+    assert StatuteDetails.slug_id(p, dt, v) == slugify(" ".join(parts))
@@ -1,10 +1,9 @@
-import toml
+import tomllib
 
 import statute_patterns
 
 
 def test_version():
-    assert (
-        toml.load("pyproject.toml")["tool"]["poetry"]["version"]
-        == statute_patterns.__version__
-    )
+    with open("pyproject.toml", "rb") as f:
+        pyproject = tomllib.load(f)
+    assert pyproject["tool"]["poetry"]["version"] == statute_patterns.__version__